@@ -1,15 +1,16 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime
+import inspect
 import os
+import threading
+from streamlit.runtime.scriptrunner import add_script_run_ctx
 
 # Import custom modules
-from utils.data_processor import DataProcessor
-from utils.pdf_generator import PDFReportGenerator
-from pages.company_analysis import CompanyAnalysis
-from pages.investor_analysis import InvestorAnalysis
-from pages.general_analysis import GeneralAnalysis
+from utils.data_processor import DataProcessor, investor_frame, process_data
+from utils.styles import inject_css
 
 # Configure page
 st.set_page_config(
@@ -19,141 +20,71 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for enhanced UI
-st.markdown("""
-<style>
-    /* Main dashboard styling */
-    .main > div {
-        padding-top: 2rem;
-    }
-    
-    /* Enhanced sidebar styling */
-    .css-1d391kg {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    /* Card styling for metrics */
-    .metric-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        border-left: 4px solid #FF6B6B;
-        margin: 0.5rem 0;
-    }
-    
-    /* Section headers */
-    .section-header {
-        background: linear-gradient(90deg, #FF6B6B, #4ECDC4);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-size: 1.8rem;
-        font-weight: bold;
-        margin: 1.5rem 0;
-        padding: 0.5rem 0;
-        border-bottom: 2px solid #f0f2f6;
-    }
-    
-    /* Chart container styling */
-    .chart-container {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        margin: 1rem 0;
-        border: 1px solid #e8e8e8;
-    }
-    
-    /* Enhanced button styling */
-    .stButton > button {
-        background: linear-gradient(45deg, #FF6B6B, #4ECDC4);
-        color: white;
-        border: none;
-        padding: 0.5rem 1rem;
-        border-radius: 25px;
-        font-weight: bold;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 15px rgba(255, 107, 107, 0.4);
-    }
-    
-    /* Selectbox styling */
-    .stSelectbox > div > div {
-        background: white;
-        border: 2px solid #e8e8e8;
-        border-radius: 10px;
-        transition: border-color 0.3s ease;
-    }
-    
-    .stSelectbox > div > div:focus-within {
-        border-color: #FF6B6B;
-        box-shadow: 0 0 10px rgba(255, 107, 107, 0.3);
-    }
-    
-    /* Info boxes */
-    .info-box {
-        background: #f8f9fa;
-        border: 1px solid #dee2e6;
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 1rem 0;
-        border-left: 4px solid #4ECDC4;
-    }
-    
-    /* Table styling */
-    .dataframe {
-        border-radius: 10px;
-        overflow: hidden;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-    }
-    
-    /* Navigation active state */
-    .nav-active {
-        background: linear-gradient(45deg, #FF6B6B, #4ECDC4);
-        color: white;
-        padding: 0.5rem;
-        border-radius: 5px;
-        margin: 0.2rem 0;
-    }
-    
-    /* Dashboard title styling */
-    .dashboard-title {
-        text-align: center;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-size: 3rem;
-        font-weight: bold;
-        margin: 1rem 0;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-    }
-    
-    /* Improved spacing */
-    .element-container {
-        margin: 0.5rem 0;
-    }
-    
-    /* Footer styling */
-    .footer {
-        text-align: center;
-        padding: 2rem;
-        color: #666;
-        border-top: 1px solid #e8e8e8;
-        margin-top: 3rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+DATA_PATH = 'attached_assets/startup_cleaned_1750747387667.csv'
+# The only CSV columns the dashboard pages read
+CSV_COLUMNS = ['date', 'startup', 'vertical', 'subvertical', 'city', 'investors', 'round', 'amount']
+CSV_DTYPES = {
+    'startup': 'string[pyarrow]',
+    'investors': 'string[pyarrow]',
+    'vertical': 'category',
+    'subvertical': 'category',
+    'city': 'category',
+    'round': 'category',
+    'amount': 'float64'
+}
+# Plain Parquet string columns load as Arrow-backed strings rather than round-tripping through Python objects
+PARQUET_TYPES = {
+    pa.string(): pd.StringDtype('pyarrow'),
+    pa.large_string(): pd.StringDtype('pyarrow')
+}
+
+# Files larger than this are parsed in chunks to bound peak memory on small hosts
+CHUNKED_READ_BYTES = 256 * 1024 * 1024
+CSV_CHUNKSIZE = 100_000
+
+def read_csv(csv_path):
+    """Read the raw CSV with the multithreaded pyarrow parser and typed columns"""
+    if os.path.getsize(csv_path) > CHUNKED_READ_BYTES:
+        # The pyarrow engine cannot stream, so large files go through the C parser chunk by chunk
+        chunks = pd.read_csv(csv_path, usecols=CSV_COLUMNS, parse_dates=['date'], dtype=CSV_DTYPES, float_precision='round_trip', chunksize=CSV_CHUNKSIZE)
+        return pd.concat(chunks, ignore_index=True)
+    return pd.read_csv(csv_path, engine='pyarrow', usecols=CSV_COLUMNS, parse_dates=['date'], dtype=CSV_DTYPES)
+
+@st.cache_data(show_spinner=False)
+def get_processed_df(csv_path, mtime):
+    """Load and process the startup funding data, cached until the file changes"""
+    # The Parquet copy is only trusted if it is newer than the CSV, the processing code and this file's CSV read settings
+    parquet_path = csv_path + '.parquet'
+    source_mtime = max(mtime, os.path.getmtime(inspect.getfile(process_data)), os.path.getmtime(__file__))
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) > source_mtime:
+        # Categoricals and the narrow integer columns come back from the Parquet schema as stored
+        return pq.read_table(parquet_path).to_pandas(types_mapper=PARQUET_TYPES.get)
+    
+    processed_df = process_data(read_csv(csv_path))
+    try:
+        processed_df.to_parquet(parquet_path, engine='pyarrow', compression='zstd')
+    except OSError:
+        # Read-only deployments simply re-parse the CSV on cold start
+        pass
+    return processed_df
+
+@st.cache_resource(show_spinner=False)
+def get_data_processor(csv_path, mtime):
+    """Build one DataProcessor per dataset version and share it across reruns"""
+    return DataProcessor(get_processed_df(csv_path, mtime))
+
+@st.cache_resource(show_spinner=False)
+def warm_data_cache(csv_path, mtime):
+    """Start building the shared data processor in a background thread, once per process"""
+    thread = threading.Thread(target=get_data_processor, args=(csv_path, mtime), daemon=True)
+    add_script_run_ctx(thread)
+    thread.start()
+    return thread
 
-@st.cache_data
 def load_data():
-    """Load and cache the startup funding data"""
+    """Load the shared data processor for the processed startup funding data"""
     try:
-        # Try to load from the uploaded file path
-        df = pd.read_csv('attached_assets/startup_cleaned_1750747387667.csv')
-        return df
+        return get_data_processor(DATA_PATH, os.path.getmtime(DATA_PATH))
     except FileNotFoundError:
         st.error("Dataset file not found. Please ensure the CSV file is in the correct location.")
         return None
@@ -161,21 +92,38 @@ def load_data():
         st.error(f"Error loading data: {str(e)}")
         return None
 
+@st.cache_data(show_spinner=False)
+def sidebar_stats(_df, version):
+    """Compute the dataset overview figures shown in the sidebar, keyed on the dataset version"""
+    # Count individual names from the shared exploded frame the Investor page also uses
+    investors = investor_frame(_df)['investor']
+    
+    return {
+        'total_records': len(_df),
+        'unique_startups': _df['startup'].nunique(),
+        'active_investors': investors.nunique(),
+        'min_date': _df['date'].min(),
+        'max_date': _df['date'].max()
+    }
+
 def main():
     """Main application function"""
     
+    # Load data in the background while the header renders; load_data() waits on the same cache entry
+    if os.path.exists(DATA_PATH):
+        warm_data_cache(DATA_PATH, os.path.getmtime(DATA_PATH))
+    
+    inject_css()
+    
     # Add dashboard title with enhanced styling
     st.markdown('<h1 class="dashboard-title">🚀 Indian Startup Funding Dashboard</h1>', unsafe_allow_html=True)
     st.markdown('<div class="info-box">Comprehensive analysis of Indian startup ecosystem with interactive visualizations and insights</div>', unsafe_allow_html=True)
     
-    # Load data
-    df = load_data()
-    if df is None:
+    # Load processed data
+    data_processor = load_data()
+    if data_processor is None:
         st.stop()
-    
-    # Initialize data processor
-    data_processor = DataProcessor(df)
-    processed_df = data_processor.process_data()
+    processed_df = data_processor.df
     
     # Enhanced sidebar navigation
     st.sidebar.markdown("## 🚀 Navigation")
@@ -192,40 +140,23 @@ def main():
     st.sidebar.markdown("---")
     st.sidebar.markdown("## 📈 Dataset Overview")
     
-    # Create info cards in sidebar
-    st.sidebar.markdown(f"""
-    <div class="metric-card">
-        <h4>📊 Total Records</h4>
-        <h2>{len(processed_df):,}</h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.sidebar.markdown(f"""
-    <div class="metric-card">
-        <h4>🏢 Unique Startups</h4>
-        <h2>{processed_df['startup'].nunique():,}</h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.sidebar.markdown(f"""
-    <div class="metric-card">
-        <h4>💼 Active Investors</h4>
-        <h2>{processed_df['investors'].nunique():,}</h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
+    # Dataset stats as native metric widgets
+    stats = sidebar_stats(processed_df, os.path.getmtime(DATA_PATH))
+    st.sidebar.metric("📊 Total Records", f"{stats['total_records']:,}")
+    st.sidebar.metric("🏢 Unique Startups", f"{stats['unique_startups']:,}")
+    st.sidebar.metric("💼 Active Investors", f"{stats['active_investors']:,}")
     st.sidebar.markdown(f"""
     <div class="info-box">
         <strong>📅 Date Range:</strong><br>
-        {processed_df['date'].min().strftime('%B %d, %Y')} to<br>
-        {processed_df['date'].max().strftime('%B %d, %Y')}
+        {stats['min_date'].strftime('%B %d, %Y')} to<br>
+        {stats['max_date'].strftime('%B %d, %Y')}
     </div>
     """, unsafe_allow_html=True)
     
     # Add feature highlights
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("## ✨ Features")
     st.sidebar.markdown("""
+    ---
+    ## ✨ Features
     • **Startup Analysis**: Detailed company profiles and funding history
     • **Investor Insights**: Investment patterns and portfolio analysis  
     • **Market Trends**: Sector analysis and funding heatmaps
@@ -238,6 +169,7 @@ def main():
     if st.sidebar.button("📥 Generate PDF Report", help="Download comprehensive insights as PDF"):
         try:
             with st.spinner("Generating PDF report..."):
+                from utils.pdf_generator import PDFReportGenerator
                 pdf_generator = PDFReportGenerator(processed_df, data_processor)
                 filename = pdf_generator.generate_pdf_report()
                 
@@ -254,7 +186,6 @@ def main():
                 st.sidebar.success("PDF report generated successfully!")
                 
                 # Clean up temporary file
-                import os
                 if os.path.exists(filename):
                     os.remove(filename)
                     
@@ -271,16 +202,19 @@ def main():
     • Funding rounds breakdown
     """)
     
-    # Route to appropriate page with enhanced containers
+    # Route to appropriate page with enhanced containers; page modules are only imported when selected
     if page == "🏢 Startup Analysis":
+        from pages.company_analysis import CompanyAnalysis
         with st.container():
-            company_analysis = CompanyAnalysis(processed_df)
+            company_analysis = CompanyAnalysis(processed_df, data_processor)
             company_analysis.render()
     elif page == "💼 Investor Analysis":
+        from pages.investor_analysis import InvestorAnalysis
         with st.container():
-            investor_analysis = InvestorAnalysis(processed_df)
+            investor_analysis = InvestorAnalysis(processed_df, data_processor)
             investor_analysis.render()
     elif page == "📊 General Analysis":
+        from pages.general_analysis import GeneralAnalysis
         with st.container():
             general_analysis = GeneralAnalysis(processed_df)
             general_analysis.render()
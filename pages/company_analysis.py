@@ -1,30 +1,101 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-from utils.visualizations import Visualizations
-from utils.data_processor import DataProcessor
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from utils.visualizations import shared_visualizations
+from utils.formatting import format_amounts
+from utils.data_processor import DATASET_CACHE_ENTRIES, DataProcessor, company_summary
+
+# Short detail tables get a fixed size so the frontend does not re-measure them against the container
+TABLE_WIDTH = 800
+TABLE_MAX_HEIGHT = 400
+
+def table_height(df):
+    """Pixel height that fits a short table's header and rows, capped for long histories"""
+    return min(35 * (len(df) + 1) + 3, TABLE_MAX_HEIGHT)
+
+def metric_card(title, value, caption, tag='h3'):
+    """HTML for a single metric card"""
+    return f'<div class="metric-card"><h4>{title}</h4><{tag}>{value}</{tag}><small>{caption}</small></div>'
+
+def cards_grid(cards, columns):
+    """Lay metric cards out in one grid row, keeping an empty slot for each missing card"""
+    slots = ''.join(card or '<div></div>' for card in cards)
+    return f'<div class="cards-grid" style="grid-template-columns: repeat({columns}, minmax(0, 1fr));">{slots}</div>'
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id}, max_entries=DATASET_CACHE_ENTRIES)
+def company_overview_data(df):
+    """Aggregate the startup overview tables in one pass, keyed on the identity of the shared processed frame"""
+    return {
+        'total_companies': len(df['startup'].cat.categories),
+        'total_funding': df['amount'].sum(),
+        'avg_funding': df['amount'].mean(),
+        'max_funding': df['amount'].max(),
+        'industry_counts': df['vertical'].value_counts().head(10),
+        'industry_funding': df.groupby('vertical', observed=True, sort=False)['amount'].sum().nlargest(10),
+        'city_counts': df['city'].value_counts().head(10),
+        'stage_counts': df['round'].value_counts().head(10),
+        'top_companies': company_summary(df).nlargest(20, 'total_amount')
+    }
+
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: id}, max_entries=DATASET_CACHE_ENTRIES)
+def company_overview_figure(df):
+    """Industry, city and stage charts of the overview in one 2 x 2 figure, built once per shared processed frame"""
+    overview = company_overview_data(df)
+    industry_counts = overview['industry_counts']
+    industry_funding = overview['industry_funding']
+    city_counts = overview['city_counts']
+    stage_counts = overview['stage_counts']
+    
+    fig = make_subplots(
+        rows=2,
+        cols=2,
+        specs=[[{'type': 'domain'}, {'type': 'xy'}], [{'type': 'xy'}, {'type': 'domain'}]],
+        subplot_titles=(
+            "Top 10 Industries by Startup Count",
+            "Top 10 Industries by Total Funding",
+            "Top 10 Cities by Startup Count",
+            "Funding Stages Distribution"
+        ),
+        vertical_spacing=0.2
+    )
+    fig.add_trace(go.Pie(labels=industry_counts.index, values=industry_counts.to_numpy(), name="Startups"), row=1, col=1)
+    fig.add_trace(go.Bar(x=industry_funding.index, y=industry_funding.to_numpy(), name="Funding (₹M)"), row=1, col=2)
+    fig.add_trace(go.Bar(x=city_counts.index, y=city_counts.to_numpy(), name="Startups"), row=2, col=1)
+    fig.add_trace(go.Pie(labels=stage_counts.index, values=stage_counts.to_numpy(), name="Rounds"), row=2, col=2)
+    
+    fig.update_traces(textposition='inside', textinfo='percent+label', selector=dict(type='pie'))
+    fig.update_xaxes(tickangle=-45)
+    # Pie slices are labelled in place, so a shared legend would only repeat them
+    fig.update_layout(height=900, showlegend=False)
+    return fig
 
 class CompanyAnalysis:
-    def __init__(self, df):
+    def __init__(self, df, data_processor=None):
         self.df = df
-        self.viz = Visualizations()
-        self.data_processor = DataProcessor(df)
+        self.viz = shared_visualizations()
+        self.data_processor = data_processor or DataProcessor(df)
+        # The startup categories are already sorted and deduplicated, so the search options need no unique/sort pass
+        self.companies = list(df['startup'].cat.categories)
     
     def render(self):
         """Render the company analysis page"""
         st.markdown('<h2 class="section-header">🏢 Startup Analysis</h2>', unsafe_allow_html=True)
         st.markdown('<div class="info-box">Explore detailed insights about Indian startups, their funding journey, and industry comparisons</div>', unsafe_allow_html=True)
         
+        self.display_search()
+    
+    @st.fragment
+    def display_search(self):
+        """Display the startup search and its results; picking a startup only reruns this block"""
         # Enhanced search section
         st.markdown("### 🔍 Startup Search")
         col1, col2 = st.columns([3, 1])
         
         with col1:
-            # Get unique companies
-            companies = sorted(self.df['startup'].unique())
             selected_company = st.selectbox(
                 "🔍 Search and Select Startup",
-                options=[""] + companies,
+                options=[""] + self.companies,
                 help="Type to search for a startup and explore its funding journey"
             )
         
@@ -33,7 +104,7 @@ class CompanyAnalysis:
             st.markdown(f"""
             <div class="metric-card">
                 <h4>🏢 Total Startups</h4>
-                <h2>{self.df['startup'].nunique():,}</h2>
+                <h2>{len(self.companies):,}</h2>
             </div>
             """, unsafe_allow_html=True)
         
@@ -53,108 +124,56 @@ class CompanyAnalysis:
         # Enhanced company header
         st.markdown(f'<h2 class="section-header">📊 {company_info["name"]}</h2>', unsafe_allow_html=True)
         
-        # Basic information cards with enhanced styling
-        st.markdown("#### 🏭 Company Profile")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>🏭 Industry</h4>
-                <h3>{company_info['industry']}</h3>
-                <small>Primary industry vertical</small>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>🎯 Sub-Industry</h4>
-                <h3>{company_info['subindustry']}</h3>
-                <small>Specific sub-vertical</small>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>📍 Location</h4>
-                <h3>{company_info['location']}</h3>
-                <small>Primary business location</small>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>🔄 Funding Rounds</h4>
-                <h3>{company_info['funding_rounds']}</h3>
-                <small>Total number of rounds</small>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Enhanced funding metrics
-        st.markdown("#### 💰 Funding Overview")
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>💰 Total Funding</h4>
-                <h2>₹{company_info['total_funding']:.2f}M</h2>
-                <small>Total funding raised across all rounds</small>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            if company_info['funding_rounds'] > 0:
-                avg_funding = company_info['total_funding'] / company_info['funding_rounds']
-                st.markdown(f"""
-                <div class="metric-card">
-                    <h4>📊 Avg. Round Size</h4>
-                    <h2>₹{avg_funding:.2f}M</h2>
-                    <small>Average funding per round</small>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        with col3:
-            if pd.notna(company_info['last_funding_date']):
-                st.markdown(f"""
-                <div class="metric-card">
-                    <h4>📅 Last Funding</h4>
-                    <h2>{company_info['last_funding_date'].strftime('%Y-%m-%d')}</h2>
-                    <small>Date of most recent funding</small>
-                </div>
-                """, unsafe_allow_html=True)
+        # Profile and funding cards go out as one HTML block laid out by CSS grid, not as separate columns
+        funding_rounds = company_info['funding_rounds']
+        last_funding_date = company_info['last_funding_date']
+        profile_cards = [
+            metric_card("🏭 Industry", company_info['industry'], "Primary industry vertical"),
+            metric_card("🎯 Sub-Industry", company_info['subindustry'], "Specific sub-vertical"),
+            metric_card("📍 Location", company_info['location'], "Primary business location"),
+            metric_card("🔄 Funding Rounds", funding_rounds, "Total number of rounds")
+        ]
+        funding_cards = [
+            metric_card("💰 Total Funding", f"₹{company_info['total_funding']:.2f}M", "Total funding raised across all rounds", tag='h2'),
+            metric_card("📊 Avg. Round Size", f"₹{company_info['total_funding'] / funding_rounds:.2f}M", "Average funding per round", tag='h2') if funding_rounds > 0 else None,
+            metric_card("📅 Last Funding", last_funding_date.strftime('%Y-%m-%d'), "Date of most recent funding", tag='h2') if pd.notna(last_funding_date) else None
+        ]
+        st.markdown(
+            '<h4>🏭 Company Profile</h4>' + cards_grid(profile_cards, 4) +
+            '<h4>💰 Funding Overview</h4>' + cards_grid(funding_cards, 3),
+            unsafe_allow_html=True
+        )
         
         st.markdown("---")
         
         # Enhanced funding rounds details
         st.markdown('<h3 class="section-header">💰 Funding History</h3>', unsafe_allow_html=True)
         
-        if not company_info['funding_history'].empty:
-            funding_df = company_info['funding_history'].copy()
-            funding_df['date'] = funding_df['date'].dt.strftime('%Y-%m-%d')
-            funding_df['amount'] = funding_df['amount'].apply(lambda x: f"₹{x:.2f}M" if x > 0 else "Undisclosed")
+        funding_history = company_info['funding_history']
+        if not funding_history.empty:
+            # Only amounts are formatted in Python, to spell out undisclosed rounds; the table formats the dates
+            funding_df = funding_history.assign(amount=format_amounts(funding_history['amount'], undisclosed=True))
             
             # Display enhanced funding table
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.dataframe(
-                funding_df[['date', 'round', 'amount', 'investors']],
+                funding_df,
                 column_config={
-                    "date": "📅 Date",
+                    "date": st.column_config.DateColumn("📅 Date", format="YYYY-MM-DD"),
                     "round": "🔄 Round Type",
                     "amount": "💰 Amount",
                     "investors": "💼 Investors"
                 },
-                use_container_width=True
+                width=TABLE_WIDTH,
+                height=table_height(funding_df),
+                hide_index=True
             )
             st.markdown('</div>', unsafe_allow_html=True)
             
             # Funding timeline chart
             if len(funding_df) > 1:
-                timeline_data = company_info['funding_history'].copy()
-                timeline_data = timeline_data[timeline_data['amount'] > 0]  # Only include disclosed amounts
+                # Only disclosed amounts, and only the charted columns so the cached chart hashes less
+                timeline_data = funding_history.loc[funding_history['amount'] > 0, ['date', 'amount']]
                 
                 if not timeline_data.empty:
                     st.markdown('<div class="chart-container">', unsafe_allow_html=True)
@@ -174,24 +193,23 @@ class CompanyAnalysis:
         
         # Enhanced similar companies section
         st.markdown('<h3 class="section-header">🔍 Similar Startups</h3>', unsafe_allow_html=True)
-        similar_companies = self.data_processor.find_similar_companies(self.df, company_name)
+        similar_df = self.data_processor.find_similar_companies(self.df, company_name)
         
-        if similar_companies:
-            similar_df = pd.DataFrame(similar_companies)
-            similar_df['amount'] = similar_df['amount'].apply(lambda x: f"₹{x:.2f}M")
-            similar_df['date'] = pd.to_datetime(similar_df['date']).dt.strftime('%Y-%m-%d')
-            
+        if not similar_df.empty:
+            # Amounts and dates stay typed and are formatted by the table itself
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
             st.dataframe(
-                similar_df[['startup', 'vertical', 'city', 'amount', 'date']],
+                similar_df[['startup', 'vertical', 'city', 'total_amount', 'last_date']],
                 column_config={
                     "startup": "🏢 Startup",
                     "vertical": "🏭 Industry",
                     "city": "📍 Location",
-                    "amount": "💰 Total Funding",
-                    "date": "📅 Last Funding"
+                    "total_amount": st.column_config.NumberColumn("💰 Total Funding", format="₹%.2fM"),
+                    "last_date": st.column_config.DateColumn("📅 Last Funding", format="YYYY-MM-DD")
                 },
-                use_container_width=True
+                width=TABLE_WIDTH,
+                height=table_height(similar_df),
+                hide_index=True
             )
             st.markdown('</div>', unsafe_allow_html=True)
         else:
@@ -202,11 +220,13 @@ class CompanyAnalysis:
         st.markdown('<h3 class="section-header">📈 Startup Overview</h3>', unsafe_allow_html=True)
         st.markdown('<div class="info-box">Comprehensive overview of all startups in the Indian ecosystem</div>', unsafe_allow_html=True)
         
+        overview = company_overview_data(self.df)
+        
         # Enhanced top metrics
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            total_companies = self.df['startup'].nunique()
+            total_companies = overview['total_companies']
             st.markdown(f"""
             <div class="metric-card">
                 <h4>🏢 Total Startups</h4>
@@ -216,7 +236,7 @@ class CompanyAnalysis:
             """, unsafe_allow_html=True)
         
         with col2:
-            total_funding = self.df['amount'].sum()
+            total_funding = overview['total_funding']
             st.markdown(f"""
             <div class="metric-card">
                 <h4>💰 Total Funding</h4>
@@ -226,7 +246,7 @@ class CompanyAnalysis:
             """, unsafe_allow_html=True)
         
         with col3:
-            avg_funding = self.df['amount'].mean()
+            avg_funding = overview['avg_funding']
             st.markdown(f"""
             <div class="metric-card">
                 <h4>📊 Avg. Funding</h4>
@@ -236,7 +256,7 @@ class CompanyAnalysis:
             """, unsafe_allow_html=True)
         
         with col4:
-            max_funding = self.df['amount'].max()
+            max_funding = overview['max_funding']
             st.markdown(f"""
             <div class="metric-card">
                 <h4>🚀 Largest Round</h4>
@@ -247,77 +267,23 @@ class CompanyAnalysis:
         
         st.markdown("---")
         
-        # Industry distribution
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("🏭 Industry Distribution")
-            industry_counts = self.df['vertical'].value_counts().head(10)
-            fig = self.viz.create_pie_chart(
-                pd.DataFrame({'industry': industry_counts.index, 'count': industry_counts.values}),
-                values='count',
-                names='industry',
-                title="Top 10 Industries by Startup Count"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.subheader("💰 Industry Funding")
-            industry_funding = self.df.groupby('vertical')['amount'].sum().sort_values(ascending=False).head(10)
-            fig = self.viz.create_bar_chart(
-                pd.DataFrame({'industry': industry_funding.index, 'funding': industry_funding.values}),
-                x='industry',
-                y='funding',
-                title="Top 10 Industries by Total Funding"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # City-wise analysis
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("🏙️ City Distribution")
-            city_counts = self.df['city'].value_counts().head(10)
-            fig = self.viz.create_bar_chart(
-                pd.DataFrame({'city': city_counts.index, 'count': city_counts.values}),
-                x='city',
-                y='count',
-                title="Top 10 Cities by Startup Count"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.subheader("💼 Funding Stages")
-            stage_counts = self.df['round'].value_counts().head(10)
-            fig = self.viz.create_pie_chart(
-                pd.DataFrame({'stage': stage_counts.index, 'count': stage_counts.values}),
-                values='count',
-                names='stage',
-                title="Funding Stages Distribution"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        # Industry, city and stage distributions as one figure
+        st.subheader("🏭 Industry, City & Stage Distribution")
+        st.plotly_chart(company_overview_figure(self.df), use_container_width=True)
         
         # Top funded companies
         st.subheader("🏆 Top Funded Startups")
-        top_companies = self.df.groupby('startup').agg({
-            'amount': 'sum',
-            'vertical': 'first',
-            'city': 'first',
-            'date': 'max'
-        }).reset_index()
-        
-        top_companies = top_companies.sort_values('amount', ascending=False).head(20)
-        top_companies['amount'] = top_companies['amount'].apply(lambda x: f"₹{x:.2f}M")
-        top_companies['date'] = pd.to_datetime(top_companies['date']).dt.strftime('%Y-%m-%d')
+        top_companies = overview['top_companies']
         
         st.dataframe(
-            top_companies[['startup', 'vertical', 'city', 'amount', 'date']],
+            top_companies[['startup', 'vertical', 'city', 'total_amount', 'last_date']],
             column_config={
                 "startup": "Startup",
                 "vertical": "Industry",
                 "city": "Location",
-                "amount": "Total Funding",
-                "date": "Last Funding"
+                "total_amount": st.column_config.NumberColumn("Total Funding", format="₹%.2fM"),
+                "last_date": st.column_config.DateColumn("Last Funding", format="YYYY-MM-DD")
             },
-            use_container_width=True
+            use_container_width=True,
+            hide_index=True
         )
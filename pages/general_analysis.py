@@ -3,13 +3,157 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from utils.visualizations import Visualizations
+from utils.visualizations import shared_visualizations
 from utils.chart_exporter import ChartExporter
+from utils.data_processor import investor_frame
+
+# Abbreviated month names indexed by month number
+MONTH_ABBR = np.array(['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+
+def filter_by_date(df, start_date, end_date):
+    """Rows of the processed frame whose date falls within the selected range"""
+    # The processed frame is sorted newest first, so the range is one contiguous block found by binary search
+    dates = df['date'].to_numpy()[::-1]
+    first = len(dates) - np.searchsorted(dates, np.datetime64(end_date) + np.timedelta64(1, 'D'))
+    last = len(dates) - np.searchsorted(dates, np.datetime64(start_date))
+    return df.iloc[first:last]
+
+def deal_breakdowns(df):
+    """Headline figures and the sector, stage and city breakdowns of a date-filtered frame"""
+    # Sector analysis by count and sum; the groupbys skip key sorting and the displays pick their top rows with nlargest
+    sector_analysis = df.groupby('vertical', observed=True, sort=False).agg(
+        deal_count=('startup', 'count'),
+        total_funding=('amount', 'sum'),
+        avg_funding=('amount', 'mean')
+    ).rename_axis('sector').reset_index()
+    
+    stage_analysis = df.groupby('round', observed=True, sort=False).agg(
+        deal_count=('startup', 'count'),
+        total_funding=('amount', 'sum'),
+        avg_funding=('amount', 'mean')
+    ).rename_axis('stage').reset_index()
+    
+    city_analysis = df.groupby('city', observed=True, sort=False).agg(
+        deal_count=('startup', 'count'),
+        total_funding=('amount', 'sum')
+    ).rename_axis('city').reset_index()
+    
+    # One argmax over the raw amounts gives both the largest round and its startup
+    amounts = df['amount'].to_numpy()
+    largest = amounts.argmax()
+    
+    return {
+        'total_startups': df['startup'].nunique(),
+        'total_funding': df['amount'].sum(),
+        'avg_funding': df['amount'].mean(),
+        'max_funding': amounts[largest],
+        'max_startup': df['startup'].iloc[largest],
+        'sector_analysis': sector_analysis,
+        'stage_analysis': stage_analysis,
+        'top_cities': city_analysis.nlargest(10, 'total_funding')
+    }
+
+def startup_rankings(df):
+    """Overall and per-year startup funding leaderboards of a date-filtered frame"""
+    top_startups = df.groupby('startup', observed=True, sort=False).agg({
+        'amount': 'sum',
+        'vertical': 'first',
+        'city': 'first'
+    }).reset_index()
+    top_startups = top_startups.nlargest(15, 'amount')
+    
+    # Per-year startup totals in one pass, so the year selector only slices
+    yearly_startups = df.groupby(['year', 'startup'], observed=True, sort=False).agg({
+        'amount': 'sum',
+        'vertical': 'first',
+        'city': 'first'
+    })
+    
+    return {
+        'top_startups': top_startups,
+        'years': sorted(df['year'].unique(), reverse=True),
+        'yearly_startups': yearly_startups
+    }
+
+def investor_rankings(investor_df):
+    """Investor count and top investors of a date-filtered exploded investor frame"""
+    # Sum straight over the investor category codes
+    investor_codes = investor_df['investor'].cat.codes.to_numpy()
+    investor_names = investor_df['investor'].cat.categories
+    top_investors = pd.DataFrame({
+        'investor': investor_names,
+        'total_amount': np.bincount(investor_codes, weights=investor_df['amount'].to_numpy(), minlength=len(investor_names)),
+        'investment_count': np.bincount(investor_codes, minlength=len(investor_names))
+    })
+    # The categories span every investor, so drop those with no deals in the range
+    top_investors = top_investors[top_investors['investment_count'] > 0].nlargest(20, 'total_amount')
+    
+    return {
+        'total_investors': investor_df['investor'].nunique(),
+        'top_investors': top_investors
+    }
+
+def heatmap_grids(df):
+    """Year x month heatmap grids, the monthly series and the best month, year and quarter totals of a date-filtered frame"""
+    # Bin each deal into a flat (year, month) cell
+    year_codes, years = pd.factorize(df['year'], sort=True)
+    cells = year_codes * 12 + (df['month'].to_numpy() - 1)
+    grids = {
+        'amount': np.bincount(cells, weights=df['amount'].to_numpy(), minlength=len(years) * 12),
+        'startup': np.bincount(cells, minlength=len(years) * 12)
+    }
+    # The month-over-month series is the non-empty cells in time order
+    deal_cells = np.flatnonzero(grids['startup'])
+    monthly_data = pd.DataFrame({
+        'date': pd.to_datetime(pd.DataFrame({'year': years[deal_cells // 12], 'month': deal_cells % 12 + 1, 'day': 1})),
+        'deal_count': grids['startup'][deal_cells],
+        'total_amount': grids['amount'][deal_cells]
+    })
+    
+    # Only months that saw a deal get a column, as the pivot previously produced
+    active_months = grids['startup'].reshape(-1, 12).sum(axis=0) > 0
+    heatmap_pivots = {
+        value_col: pd.DataFrame(
+            grid.reshape(-1, 12)[:, active_months],
+            index=pd.Index(years, name='year'),
+            columns=pd.Index(np.arange(1, 13)[active_months], name='month')
+        )
+        for value_col, grid in grids.items()
+    }
+    
+    # The insight cards roll up the year x month amount pivot instead of rescanning the frame
+    amount_pivot = heatmap_pivots['amount']
+    quarters = (amount_pivot.columns - 1) // 3 + 1
+    
+    return {
+        'monthly_data': monthly_data,
+        'heatmap_pivots': heatmap_pivots,
+        'monthly_totals': amount_pivot.sum(axis=0),
+        'yearly_totals': amount_pivot.sum(axis=1),
+        'quarterly_totals': amount_pivot.T.groupby(quarters).sum().sum(axis=1)
+    }
+
+# Each date range a user picks gets its own overview; keep only the most recent ones
+DATE_RANGE_CACHE_ENTRIES = 32
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id}, max_entries=DATE_RANGE_CACHE_ENTRIES)
+def general_overview_data(df, start_date, end_date):
+    """Aggregate the General Analysis tables for a date range, keyed on the identity of the shared processed frame"""
+    # The shared exploded frame keeps the newest-first row order, so it slices by date the same way
+    investor_df = filter_by_date(investor_frame(df), start_date, end_date)
+    df = filter_by_date(df, start_date, end_date)
+    
+    return {
+        **deal_breakdowns(df),
+        **startup_rankings(df),
+        **investor_rankings(investor_df),
+        **heatmap_grids(df)
+    }
 
 class GeneralAnalysis:
     def __init__(self, df):
         self.df = df
-        self.viz = Visualizations()
+        self.viz = shared_visualizations()
     
     def render(self):
         """Render the general analysis page"""
@@ -28,26 +172,26 @@ class GeneralAnalysis:
             end_date = st.date_input("End Date", max_date)
         
         # Filter data by date range
-        filtered_df = self.df[
-            (self.df['date'].dt.date >= start_date) & 
-            (self.df['date'].dt.date <= end_date)
-        ]
+        filtered_df = filter_by_date(self.df, start_date, end_date)
         
         with col3:
             st.info(f"Showing data from {start_date} to {end_date} ({len(filtered_df):,} records)")
         
+        # Aggregations are cached per date range, so reruns from other widgets reuse them
+        overview = general_overview_data(self.df, start_date, end_date)
+        
         # Summary cards
-        self.display_summary_cards(filtered_df)
+        self.display_summary_cards(overview)
         
         st.markdown("---")
         
         # MoM analysis
-        self.display_mom_analysis(filtered_df)
+        self.display_mom_analysis(overview)
         
         st.markdown("---")
         
         # Sector analysis
-        self.display_sector_analysis(filtered_df)
+        self.display_sector_analysis(overview)
         
         st.markdown("---")
         
@@ -55,34 +199,34 @@ class GeneralAnalysis:
         col1, col2 = st.columns(2)
         
         with col1:
-            self.display_funding_type_analysis(filtered_df)
+            self.display_funding_type_analysis(overview)
         
         with col2:
-            self.display_city_analysis(filtered_df)
+            self.display_city_analysis(overview)
         
         st.markdown("---")
         
         # Top performers
-        self.display_top_performers(filtered_df)
+        self.display_top_performers(overview)
         
         st.markdown("---")
         
         # Funding heatmap
-        self.display_funding_heatmap(filtered_df)
+        self.display_funding_heatmap(overview)
         
         # Export section
         st.markdown("---")
         chart_exporter = ChartExporter(filtered_df)
         chart_exporter.export_all_charts_section()
     
-    def display_summary_cards(self, df):
+    def display_summary_cards(self, overview):
         """Display summary metrics cards"""
         st.markdown('<h3 class="section-header">📈 Key Metrics</h3>', unsafe_allow_html=True)
         
         col1, col2, col3, col4, col5 = st.columns(5)
         
         with col1:
-            total_startups = df['startup'].nunique()
+            total_startups = overview['total_startups']
             st.markdown(f"""
             <div class="metric-card">
                 <h4>🏢 Total Startups</h4>
@@ -92,7 +236,7 @@ class GeneralAnalysis:
             """, unsafe_allow_html=True)
         
         with col2:
-            total_funding = df['amount'].sum()
+            total_funding = overview['total_funding']
             st.markdown(f"""
             <div class="metric-card">
                 <h4>💰 Total Funding</h4>
@@ -102,7 +246,7 @@ class GeneralAnalysis:
             """, unsafe_allow_html=True)
         
         with col3:
-            avg_funding = df['amount'].mean()
+            avg_funding = overview['avg_funding']
             st.markdown(f"""
             <div class="metric-card">
                 <h4>📊 Avg Funding</h4>
@@ -112,8 +256,8 @@ class GeneralAnalysis:
             """, unsafe_allow_html=True)
         
         with col4:
-            max_funding = df['amount'].max()
-            max_startup = df.loc[df['amount'].idxmax(), 'startup']
+            max_funding = overview['max_funding']
+            max_startup = overview['max_startup']
             st.markdown(f"""
             <div class="metric-card">
                 <h4>🚀 Largest Round</h4>
@@ -123,12 +267,7 @@ class GeneralAnalysis:
             """, unsafe_allow_html=True)
         
         with col5:
-            total_investors = len(set([
-                investor.strip() 
-                for investors_str in df['investors'].dropna() 
-                for investor in str(investors_str).split(',')
-                if investor.strip() and investor.strip().lower() != 'unknown'
-            ]))
+            total_investors = overview['total_investors']
             st.markdown(f"""
             <div class="metric-card">
                 <h4>💼 Active Investors</h4>
@@ -137,88 +276,53 @@ class GeneralAnalysis:
             </div>
             """, unsafe_allow_html=True)
     
-    def display_mom_analysis(self, df):
+    def display_mom_analysis(self, overview):
         """Display month-over-month analysis"""
         st.subheader("📅 Month-over-Month Analysis")
         
-        # Prepare monthly data
-        monthly_data = df.groupby(df['date'].dt.to_period('M')).agg({
-            'startup': 'count',
-            'amount': 'sum'
-        }).reset_index()
-        monthly_data['date'] = monthly_data['date'].dt.to_timestamp()
-        monthly_data.columns = ['date', 'deal_count', 'total_amount']
+        monthly_data = overview['monthly_data']
         
         if len(monthly_data) > 1:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                fig = self.viz.create_line_chart(
-                    monthly_data,
-                    x='date',
-                    y='deal_count',
-                    title="Monthly Deal Count",
-                    height=400
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                fig = self.viz.create_line_chart(
-                    monthly_data,
-                    x='date',
-                    y='total_amount',
-                    title="Monthly Funding Amount (₹M)",
+            # One dual-axis figure carries both monthly series
+            fig = go.Figure(
+                data=[
+                    # Deal count
+                    go.Scatter(
+                        x=monthly_data['date'],
+                        y=monthly_data['deal_count'],
+                        mode='lines+markers',
+                        name='Deal Count',
+                        yaxis='y',
+                        line=dict(color='blue')
+                    ),
+                    # Funding amount on secondary y-axis
+                    go.Scatter(
+                        x=monthly_data['date'],
+                        y=monthly_data['total_amount'],
+                        mode='lines+markers',
+                        name='Funding Amount (₹M)',
+                        yaxis='y2',
+                        line=dict(color='red')
+                    )
+                ],
+                layout=dict(
+                    title="Monthly Deals vs Funding Amount",
+                    xaxis_title="Date",
+                    yaxis=dict(title="Deal Count", side="left"),
+                    yaxis2=dict(title="Funding Amount (₹M)", side="right", overlaying="y"),
                     height=400
                 )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            # Combined chart
-            fig = go.Figure()
-            
-            # Add deal count
-            fig.add_trace(go.Scatter(
-                x=monthly_data['date'],
-                y=monthly_data['deal_count'],
-                mode='lines+markers',
-                name='Deal Count',
-                yaxis='y',
-                line=dict(color='blue')
-            ))
-            
-            # Add funding amount on secondary y-axis
-            fig.add_trace(go.Scatter(
-                x=monthly_data['date'],
-                y=monthly_data['total_amount'],
-                mode='lines+markers',
-                name='Funding Amount (₹M)',
-                yaxis='y2',
-                line=dict(color='red')
-            ))
-            
-            # Update layout for dual y-axis
-            fig.update_layout(
-                title="Monthly Deals vs Funding Amount",
-                xaxis_title="Date",
-                yaxis=dict(title="Deal Count", side="left"),
-                yaxis2=dict(title="Funding Amount (₹M)", side="right", overlaying="y"),
-                height=400
             )
             
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("Insufficient data for month-over-month analysis.")
     
-    def display_sector_analysis(self, df):
+    def display_sector_analysis(self, overview):
         """Display sector analysis"""
         st.subheader("🏭 Sector Analysis")
         
-        # Sector analysis by count and sum
-        sector_analysis = df.groupby('vertical').agg({
-            'startup': 'count',
-            'amount': 'sum'
-        }).reset_index()
-        sector_analysis.columns = ['sector', 'deal_count', 'total_funding']
-        sector_analysis = sector_analysis.sort_values('total_funding', ascending=False)
+        sector_analysis = overview['sector_analysis']
         
         col1, col2 = st.columns(2)
         
@@ -246,36 +350,29 @@ class GeneralAnalysis:
         
         # Detailed sector table
         st.write("**Detailed Sector Analysis**")
-        sector_display = sector_analysis.copy()
-        sector_display['total_funding'] = sector_display['total_funding'].apply(lambda x: f"₹{x:,.0f}M")
-        sector_display['avg_funding'] = (sector_analysis['total_funding'] / sector_analysis['deal_count']).apply(lambda x: f"₹{x:.2f}M")
+        top_sectors = sector_analysis.nlargest(20, 'total_funding')
         
+        # Amounts stay numeric and are formatted by the table itself, which also keeps them sortable
         st.dataframe(
-            sector_display[['sector', 'deal_count', 'total_funding', 'avg_funding']].head(20),
+            top_sectors[['sector', 'deal_count', 'total_funding', 'avg_funding']],
             column_config={
                 "sector": "Sector",
                 "deal_count": "Deal Count",
-                "total_funding": "Total Funding",
-                "avg_funding": "Avg Funding"
+                "total_funding": st.column_config.NumberColumn("Total Funding", format="₹%.0fM"),
+                "avg_funding": st.column_config.NumberColumn("Avg Funding", format="₹%.2fM")
             },
             use_container_width=True
         )
     
-    def display_funding_type_analysis(self, df):
+    def display_funding_type_analysis(self, overview):
         """Display funding type analysis"""
         st.subheader("💼 Funding Stage Analysis")
         
-        stage_analysis = df.groupby('round').agg({
-            'startup': 'count',
-            'amount': ['sum', 'mean']
-        }).reset_index()
-        
-        stage_analysis.columns = ['stage', 'deal_count', 'total_funding', 'avg_funding']
-        stage_analysis = stage_analysis.sort_values('total_funding', ascending=False)
+        stage_analysis = overview['stage_analysis']
         
         # Pie chart for funding stages
         fig = self.viz.create_pie_chart(
-            stage_analysis.head(10),
+            stage_analysis.nlargest(10, 'total_funding'),
             values='deal_count',
             names='stage',
             title="Distribution by Funding Stage",
@@ -306,19 +403,12 @@ class GeneralAnalysis:
             )
             st.plotly_chart(fig, use_container_width=True)
     
-    def display_city_analysis(self, df):
+    def display_city_analysis(self, overview):
         """Display city-wise funding analysis"""
         st.subheader("🏙️ City-wise Funding")
         
-        city_analysis = df.groupby('city').agg({
-            'startup': 'count',
-            'amount': 'sum'
-        }).reset_index()
-        city_analysis.columns = ['city', 'deal_count', 'total_funding']
-        city_analysis = city_analysis.sort_values('total_funding', ascending=False)
-        
         # Top cities by funding
-        top_cities = city_analysis.head(10)
+        top_cities = overview['top_cities']
         fig = self.viz.create_bar_chart(
             top_cities,
             x='city',
@@ -338,7 +428,7 @@ class GeneralAnalysis:
         )
         st.plotly_chart(fig, use_container_width=True)
     
-    def display_top_performers(self, df):
+    def display_top_performers(self, overview):
         """Display top performers analysis"""
         st.subheader("🏆 Top Performers")
         
@@ -346,21 +436,13 @@ class GeneralAnalysis:
         
         with col1:
             st.write("**Top Startups (Overall)**")
-            top_startups = df.groupby('startup').agg({
-                'amount': 'sum',
-                'vertical': 'first',
-                'city': 'first'
-            }).reset_index()
-            top_startups = top_startups.sort_values('amount', ascending=False).head(15)
-            
-            top_startups_display = top_startups.copy()
-            top_startups_display['amount'] = top_startups_display['amount'].apply(lambda x: f"₹{x:,.0f}M")
+            top_startups = overview['top_startups']
             
             st.dataframe(
-                top_startups_display[['startup', 'amount', 'vertical', 'city']],
+                top_startups[['startup', 'amount', 'vertical', 'city']],
                 column_config={
                     "startup": "Startup",
-                    "amount": "Total Funding",
+                    "amount": st.column_config.NumberColumn("Total Funding", format="₹%.0fM"),
                     "vertical": "Industry",
                     "city": "City"
                 },
@@ -368,84 +450,51 @@ class GeneralAnalysis:
             )
         
         with col2:
-            st.write("**Top Startups (Year-wise)**")
-            year_filter = st.selectbox(
-                "Select Year",
-                options=sorted(df['year'].unique(), reverse=True),
-                key="year_filter"
-            )
-            
-            yearly_df = df[df['year'] == year_filter]
-            top_yearly = yearly_df.groupby('startup').agg({
-                'amount': 'sum',
-                'vertical': 'first',
-                'city': 'first'
-            }).reset_index()
-            top_yearly = top_yearly.sort_values('amount', ascending=False).head(15)
-            
-            top_yearly_display = top_yearly.copy()
-            top_yearly_display['amount'] = top_yearly_display['amount'].apply(lambda x: f"₹{x:,.0f}M")
-            
-            st.dataframe(
-                top_yearly_display[['startup', 'amount', 'vertical', 'city']],
-                column_config={
-                    "startup": "Startup",
-                    "amount": f"{year_filter} Funding",
-                    "vertical": "Industry",
-                    "city": "City"
-                },
-                use_container_width=True
-            )
+            self.display_yearly_top_startups(overview)
         
         # Top investors
         st.write("**Top Investors**")
         
-        # Create investor analysis
-        investor_data = []
-        for _, row in df.iterrows():
-            investors = str(row['investors']).split(',')
-            for investor in investors:
-                investor = investor.strip()
-                if investor and investor.lower() != 'unknown':
-                    investor_data.append({
-                        'investor': investor,
-                        'amount': row['amount'],
-                        'startup': row['startup']
-                    })
-        
-        if investor_data:
-            investor_df = pd.DataFrame(investor_data)
-            top_investors = investor_df.groupby('investor').agg({
-                'amount': 'sum',
-                'startup': 'count'
-            }).reset_index()
-            top_investors.columns = ['investor', 'total_amount', 'investment_count']
-            top_investors = top_investors.sort_values('total_amount', ascending=False).head(20)
-            
-            top_investors_display = top_investors.copy()
-            top_investors_display['total_amount'] = top_investors_display['total_amount'].apply(lambda x: f"₹{x:,.0f}M")
-            
+        top_investors = overview['top_investors']
+        
+        if not top_investors.empty:
             st.dataframe(
-                top_investors_display,
+                top_investors,
                 column_config={
                     "investor": "Investor",
-                    "total_amount": "Total Invested",
+                    "total_amount": st.column_config.NumberColumn("Total Invested", format="₹%.0fM"),
                     "investment_count": "# Investments"
                 },
                 use_container_width=True
             )
     
-    def display_funding_heatmap(self, df):
-        """Display funding heatmap"""
-        st.subheader("🔥 Funding Heatmap")
+    @st.fragment
+    def display_yearly_top_startups(self, overview):
+        """Display the year-wise startup leaderboard; changing the year only reruns this block"""
+        st.write("**Top Startups (Year-wise)**")
+        year_filter = st.selectbox(
+            "Select Year",
+            options=overview['years'],
+            key="year_filter"
+        )
         
-        # Create year-month heatmap data
-        df['year_month'] = df['date'].dt.to_period('M')
-        heatmap_data = df.groupby(['year', 'month']).agg({
-            'amount': 'sum',
-            'startup': 'count'
-        }).reset_index()
+        top_yearly = overview['yearly_startups'].xs(year_filter, level='year').reset_index()
+        top_yearly = top_yearly.nlargest(15, 'amount')
         
+        st.dataframe(
+            top_yearly[['startup', 'amount', 'vertical', 'city']],
+            column_config={
+                "startup": "Startup",
+                "amount": st.column_config.NumberColumn(f"{year_filter} Funding", format="₹%.0fM"),
+                "vertical": "Industry",
+                "city": "City"
+            },
+            use_container_width=True
+        )
+    
+    @st.fragment
+    def display_heatmap_chart(self, overview):
+        """Display the year x month heatmap; switching the metric only reruns this block"""
         # Choose metric for heatmap
         metric = st.selectbox(
             "Select Metric for Heatmap",
@@ -455,19 +504,13 @@ class GeneralAnalysis:
         
         value_col = 'amount' if metric == "Total Funding Amount" else 'startup'
         
-        # Pivot data for heatmap
-        heatmap_pivot = heatmap_data.pivot_table(
-            index='year',
-            columns='month',
-            values=value_col,
-            fill_value=0
-        )
+        heatmap_pivot = overview['heatmap_pivots'][value_col]
         
         if not heatmap_pivot.empty:
             # Create heatmap
             fig = go.Figure(data=go.Heatmap(
                 z=heatmap_pivot.values,
-                x=[f"Month {i}" for i in heatmap_pivot.columns],
+                x=MONTH_ABBR[heatmap_pivot.columns],
                 y=heatmap_pivot.index,
                 colorscale='RdYlBu_r',
                 hoverongaps=False,
@@ -484,25 +527,29 @@ class GeneralAnalysis:
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("Insufficient data to generate heatmap.")
+    
+    def display_funding_heatmap(self, overview):
+        """Display funding heatmap"""
+        st.subheader("🔥 Funding Heatmap")
+        
+        self.display_heatmap_chart(overview)
         
         # Additional insights
         col1, col2, col3 = st.columns(3)
         
         with col1:
             # Best month
-            monthly_totals = df.groupby(df['date'].dt.month)['amount'].sum()
+            monthly_totals = overview['monthly_totals']
             best_month = monthly_totals.idxmax()
-            month_names = {1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun',
-                          7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'}
             st.metric(
                 "Best Month",
-                month_names.get(best_month, best_month),
+                MONTH_ABBR[best_month],
                 f"₹{monthly_totals.max():,.0f}M"
             )
         
         with col2:
             # Best year
-            yearly_totals = df.groupby('year')['amount'].sum()
+            yearly_totals = overview['yearly_totals']
             best_year = yearly_totals.idxmax()
             st.metric(
                 "Best Year",
@@ -512,7 +559,7 @@ class GeneralAnalysis:
         
         with col3:
             # Peak quarter
-            quarterly_totals = df.groupby(df['date'].dt.quarter)['amount'].sum()
+            quarterly_totals = overview['quarterly_totals']
             best_quarter = quarterly_totals.idxmax()
             st.metric(
                 "Best Quarter",
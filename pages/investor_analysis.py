@@ -1,30 +1,49 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from utils.visualizations import Visualizations
-from utils.data_processor import DataProcessor
+from utils.visualizations import shared_visualizations
+from utils.formatting import format_amounts
+from utils.data_processor import DATASET_CACHE_ENTRIES, DataProcessor, investor_frame
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id}, max_entries=DATASET_CACHE_ENTRIES)
+def investor_overview_data(df):
+    """Aggregate the investor overview tables, keyed on the identity of the shared processed frame"""
+    investor_df = investor_frame(df)
+    
+    yearly_trends = investor_df.groupby('year').agg({
+        'investor': 'count',
+        'amount': 'sum'
+    }).reset_index()
+    yearly_trends.columns = ['year', 'investment_count', 'total_amount']
+    
+    return {
+        'unique_investors': investor_df['investor'].nunique(),
+        'total_investments': len(investor_df),
+        'avg_investment': investor_df['amount'].mean(),
+        'max_investment': investor_df['amount'].max(),
+        'most_active': investor_df['investor'].value_counts().head(15),
+        'biggest_investors': investor_df.groupby('investor', observed=True)['amount'].sum().nlargest(15),
+        'sector_investments': investor_df['vertical'].value_counts().head(10),
+        'stage_investments': investor_df['round'].value_counts().head(10),
+        'city_investments': investor_df['city'].value_counts().head(15),
+        'yearly_trends': yearly_trends
+    }
 
 class InvestorAnalysis:
-    def __init__(self, df):
+    def __init__(self, df, data_processor=None):
         self.df = df
-        self.viz = Visualizations()
-        self.data_processor = DataProcessor(df)
+        self.viz = shared_visualizations()
+        self.data_processor = data_processor or DataProcessor(df)
+        # Exploded once per run and shared by the search list and the investor lookups
+        self.investor_df = investor_frame(df)
     
     def render(self):
         """Render the investor analysis page"""
         st.markdown('<h2 class="section-header">💼 Investor Analysis</h2>', unsafe_allow_html=True)
         st.markdown('<div class="info-box">Deep dive into investor behavior, portfolio analysis, and investment patterns across the Indian startup ecosystem</div>', unsafe_allow_html=True)
         
-        # Get unique investors
-        all_investors = set()
-        for investors_str in self.df['investors'].dropna():
-            investors = str(investors_str).split(',')
-            for investor in investors:
-                investor = investor.strip()
-                if investor and investor.lower() != 'unknown':
-                    all_investors.add(investor)
-        
-        investors_list = sorted(list(all_investors))
+        # Get unique investors; the exploded frame's categories are already sorted and deduplicated
+        investors_list = list(self.investor_df['investor'].cat.categories)
         
         # Enhanced investor search section
         st.markdown("### 🔍 Investor Search")
@@ -52,7 +71,7 @@ class InvestorAnalysis:
     
     def display_investor_details(self, investor_name):
         """Display detailed analysis for selected investor"""
-        investor_info = self.data_processor.get_investor_info(self.df, investor_name)
+        investor_info = self.data_processor.get_investor_info(self.df, investor_name, investor_df=self.investor_df)
         
         if not investor_info:
             st.error("Investor not found in the dataset.")
@@ -98,13 +117,16 @@ class InvestorAnalysis:
         
         # Recent investments
         st.subheader("📈 Recent Investments")
-        if not investor_info['recent_investments'].empty:
-            recent_df = investor_info['recent_investments'].copy()
-            recent_df['date'] = recent_df['date'].dt.strftime('%Y-%m-%d')
-            recent_df['amount'] = recent_df['amount'].apply(lambda x: f"₹{x:.2f}M" if x > 0 else "Undisclosed")
+        recent = investor_info['recent_investments']
+        if not recent.empty:
+            # Only the displayed columns are materialized, instead of copying the full exploded rows
+            recent_df = recent[['startup', 'date', 'round', 'amount', 'vertical', 'city']].assign(
+                date=recent['date'].dt.strftime('%Y-%m-%d'),
+                amount=format_amounts(recent['amount'], undisclosed=True)
+            )
             
             st.dataframe(
-                recent_df[['startup', 'date', 'round', 'amount', 'vertical', 'city']],
+                recent_df,
                 column_config={
                     "startup": "Company",
                     "date": "Date",
@@ -118,13 +140,15 @@ class InvestorAnalysis:
         
         # Biggest investments
         st.subheader("💰 Biggest Investments")
-        if not investor_info['biggest_investments'].empty:
-            biggest_df = investor_info['biggest_investments'].copy()
-            biggest_df['date'] = biggest_df['date'].dt.strftime('%Y-%m-%d')
-            biggest_df['amount'] = biggest_df['amount'].apply(lambda x: f"₹{x:.2f}M")
+        biggest = investor_info['biggest_investments']
+        if not biggest.empty:
+            biggest_df = biggest[['startup', 'amount', 'date', 'round', 'vertical', 'city']].assign(
+                amount=format_amounts(biggest['amount']),
+                date=biggest['date'].dt.strftime('%Y-%m-%d')
+            )
             
             st.dataframe(
-                biggest_df[['startup', 'amount', 'date', 'round', 'vertical', 'city']],
+                biggest_df,
                 column_config={
                     "startup": "Company",
                     "amount": "Amount",
@@ -144,12 +168,8 @@ class InvestorAnalysis:
         with col1:
             st.subheader("🏭 Sector Distribution")
             if not investor_info['sectors'].empty:
-                sectors_df = pd.DataFrame({
-                    'sector': investor_info['sectors'].index,
-                    'count': investor_info['sectors'].values
-                })
                 fig = self.viz.create_pie_chart(
-                    sectors_df,
+                    investor_info['sectors'],
                     values='count',
                     names='sector',
                     title="Investment by Sector"
@@ -159,12 +179,8 @@ class InvestorAnalysis:
         with col2:
             st.subheader("📊 Stage Distribution")
             if not investor_info['stages'].empty:
-                stages_df = pd.DataFrame({
-                    'stage': investor_info['stages'].index,
-                    'count': investor_info['stages'].values
-                })
                 fig = self.viz.create_pie_chart(
-                    stages_df,
+                    investor_info['stages'],
                     values='count',
                     names='stage',
                     title="Investment by Stage"
@@ -174,12 +190,8 @@ class InvestorAnalysis:
         with col3:
             st.subheader("🏙️ City Distribution")
             if not investor_info['cities'].empty:
-                cities_df = pd.DataFrame({
-                    'city': investor_info['cities'].index,
-                    'count': investor_info['cities'].values
-                })
                 fig = self.viz.create_pie_chart(
-                    cities_df,
+                    investor_info['cities'],
                     values='count',
                     names='city',
                     title="Investment by City"
@@ -213,11 +225,11 @@ class InvestorAnalysis:
         
         # Similar investors
         st.subheader("🔍 Similar Investors")
-        similar_investors = self.data_processor.find_similar_investors(self.df, investor_name)
+        similar_investors = self.data_processor.find_similar_investors(self.df, investor_name, investor_df=self.investor_df)
         
         if similar_investors:
             similar_df = pd.DataFrame(similar_investors)
-            similar_df['total_amount'] = similar_df['total_amount'].apply(lambda x: f"₹{x:.0f}M")
+            similar_df['total_amount'] = format_amounts(similar_df['total_amount'], '.0f')
             similar_df['similarity'] = similar_df['similarity'].apply(lambda x: f"{x:.2%}")
             
             st.dataframe(
@@ -237,44 +249,23 @@ class InvestorAnalysis:
         """Display overview of all investors"""
         st.subheader("📊 Investor Overview")
         
-        # Create investor analysis dataframe
-        investor_data = []
-        for _, row in self.df.iterrows():
-            investors = str(row['investors']).split(',')
-            for investor in investors:
-                investor = investor.strip()
-                if investor and investor.lower() != 'unknown':
-                    investor_data.append({
-                        'investor': investor,
-                        'startup': row['startup'],
-                        'amount': row['amount'],
-                        'vertical': row['vertical'],
-                        'round': row['round'],
-                        'city': row['city'],
-                        'year': row['year'],
-                        'date': row['date']
-                    })
-        
-        investor_df = pd.DataFrame(investor_data)
+        # Aggregations are cached, so returning to this view skips recomputation
+        overview = investor_overview_data(self.df)
         
         # Top metrics
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            unique_investors = investor_df['investor'].nunique()
-            st.metric("Total Investors", f"{unique_investors:,}")
+            st.metric("Total Investors", f"{overview['unique_investors']:,}")
         
         with col2:
-            total_investments = len(investor_df)
-            st.metric("Total Investments", f"{total_investments:,}")
+            st.metric("Total Investments", f"{overview['total_investments']:,}")
         
         with col3:
-            avg_investment = investor_df['amount'].mean()
-            st.metric("Avg Investment", f"₹{avg_investment:.2f}M")
+            st.metric("Avg Investment", f"₹{overview['avg_investment']:.2f}M")
         
         with col4:
-            max_investment = investor_df['amount'].max()
-            st.metric("Largest Investment", f"₹{max_investment:,.0f}M")
+            st.metric("Largest Investment", f"₹{overview['max_investment']:,.0f}M")
         
         st.markdown("---")
         
@@ -283,26 +274,26 @@ class InvestorAnalysis:
         
         with col1:
             st.subheader("🏆 Most Active Investors")
-            most_active = investor_df['investor'].value_counts().head(15)
+            most_active = overview['most_active']
             fig = self.viz.create_bar_chart(
-                pd.DataFrame({'investor': most_active.index, 'investments': most_active.values}),
+                most_active,
                 x='investments',
                 y='investor',
-                title="Top 15 Most Active Investors"
+                title="Top 15 Most Active Investors",
+                orientation='h'
             )
-            fig.update_layout(yaxis={'categoryorder':'total ascending'})
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             st.subheader("💰 Biggest Investors by Amount")
-            biggest_investors = investor_df.groupby('investor')['amount'].sum().sort_values(ascending=False).head(15)
+            biggest_investors = overview['biggest_investors']
             fig = self.viz.create_bar_chart(
-                pd.DataFrame({'investor': biggest_investors.index, 'amount': biggest_investors.values}),
+                biggest_investors,
                 x='amount',
                 y='investor',
-                title="Top 15 Investors by Total Amount"
+                title="Top 15 Investors by Total Amount",
+                orientation='h'
             )
-            fig.update_layout(yaxis={'categoryorder':'total ascending'})
             st.plotly_chart(fig, use_container_width=True)
         
         # Investment patterns
@@ -310,9 +301,9 @@ class InvestorAnalysis:
         
         with col1:
             st.subheader("🏭 Preferred Sectors")
-            sector_investments = investor_df['vertical'].value_counts().head(10)
+            sector_investments = overview['sector_investments']
             fig = self.viz.create_pie_chart(
-                pd.DataFrame({'sector': sector_investments.index, 'count': sector_investments.values}),
+                sector_investments,
                 values='count',
                 names='sector',
                 title="Top 10 Sectors by Investment Count"
@@ -321,9 +312,9 @@ class InvestorAnalysis:
         
         with col2:
             st.subheader("📊 Preferred Stages")
-            stage_investments = investor_df['round'].value_counts().head(10)
+            stage_investments = overview['stage_investments']
             fig = self.viz.create_pie_chart(
-                pd.DataFrame({'stage': stage_investments.index, 'count': stage_investments.values}),
+                stage_investments,
                 values='count',
                 names='stage',
                 title="Investment Distribution by Stage"
@@ -332,9 +323,9 @@ class InvestorAnalysis:
         
         # Geographic preferences
         st.subheader("🗺️ Geographic Investment Preferences")
-        city_investments = investor_df['city'].value_counts().head(15)
+        city_investments = overview['city_investments']
         fig = self.viz.create_bar_chart(
-            pd.DataFrame({'city': city_investments.index, 'investments': city_investments.values}),
+            city_investments,
             x='city',
             y='investments',
             title="Top 15 Cities by Investment Count"
@@ -343,11 +334,7 @@ class InvestorAnalysis:
         
         # Investment trends over time
         st.subheader("📈 Investment Trends Over Time")
-        yearly_trends = investor_df.groupby('year').agg({
-            'investor': 'count',
-            'amount': 'sum'
-        }).reset_index()
-        yearly_trends.columns = ['year', 'investment_count', 'total_amount']
+        yearly_trends = overview['yearly_trends']
         
         col1, col2 = st.columns(2)
         
@@ -14,7 +14,7 @@ class ChartExporter:
     
     def export_sector_analysis_chart(self):
         """Create and export sector analysis chart"""
-        sector_funding = self.df.groupby('vertical')['amount'].sum().sort_values(ascending=False).head(10)
+        sector_funding = self.df.groupby('vertical', observed=True)['amount'].sum().nlargest(10)
         
         fig = px.pie(
             values=sector_funding.values,
@@ -35,12 +35,13 @@ class ChartExporter:
     
     def export_funding_timeline_chart(self):
         """Create and export funding timeline chart"""
-        monthly_data = self.df.groupby(self.df['date'].dt.to_period('M')).agg({
+        # Group on the precomputed year and month columns rather than converting every date to a period
+        monthly_data = self.df.groupby(['year', 'month']).agg({
             'amount': 'sum',
             'startup': 'nunique'
         }).reset_index()
         
-        monthly_data['date'] = monthly_data['date'].astype(str)
+        monthly_data['date'] = monthly_data['year'].astype(str) + '-' + monthly_data['month'].astype(str).str.zfill(2)
         
         # Create dual axis chart
         fig = go.Figure()
@@ -79,7 +80,7 @@ class ChartExporter:
     
     def export_top_startups_chart(self):
         """Create and export top startups chart"""
-        top_startups = self.df.groupby('startup')['amount'].sum().sort_values(ascending=False).head(15)
+        top_startups = self.df.groupby('startup', observed=True)['amount'].sum().nlargest(15)
         
         fig = px.bar(
             x=top_startups.values,
@@ -102,10 +103,10 @@ class ChartExporter:
     
     def export_city_distribution_chart(self):
         """Create and export city distribution chart"""
-        city_data = self.df.groupby('city').agg({
+        city_data = self.df.groupby('city', observed=True).agg({
             'amount': 'sum',
             'startup': 'nunique'
-        }).sort_values('amount', ascending=False).head(10)
+        }).nlargest(10, 'amount')
         
         fig = go.Figure()
         
@@ -140,7 +141,7 @@ class ChartExporter:
     
     def export_funding_rounds_chart(self):
         """Create and export funding rounds analysis chart"""
-        round_data = self.df.groupby('round').agg({
+        round_data = self.df.groupby('round', observed=True).agg({
             'amount': ['sum', 'mean', 'count']
         }).round(2)
         
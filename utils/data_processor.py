@@ -1,99 +1,205 @@
+import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import re
 
+# Leading URLs and stray quotes in startup names. Kept as a plain pattern string: pandas hands it to
+# pyarrow's regex kernel, whereas a compiled re.Pattern forces the per-row Python fallback
+STARTUP_NOISE = r'^https?://[^\s]+|["\']'
+
+# Frame-keyed caches keep the current dataset version plus the one it replaces, so older versions are released
+DATASET_CACHE_ENTRIES = 2
+# Similar-company candidates are cached once per (vertical, sub-vertical, city) profile
+PROFILE_CACHE_ENTRIES = 256
+
+def explode_investors(df):
+    """Expand the comma-separated investors column into one row per deal and investor"""
+    exploded = df.assign(investor=df['investors'].fillna('').str.split(',')).explode('investor', ignore_index=True)
+    exploded['investor'] = exploded['investor'].str.strip()
+    exploded = exploded[
+        (exploded['investor'].str.len() > 0) &
+        (exploded['investor'].str.lower() != 'unknown')
+    ].reset_index(drop=True)
+    
+    # Per-investor slices should only count the categories they actually contain
+    category_cols = exploded.select_dtypes('category').columns
+    exploded[category_cols] = exploded[category_cols].astype(object)
+    
+    # Investor names repeat across deals, so group on integer codes rather than strings
+    exploded['investor'] = exploded['investor'].astype('category')
+    
+    return exploded
+
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: id}, max_entries=DATASET_CACHE_ENTRIES)
+def investor_frame(df):
+    """Exploded investor frame for the shared processed frame, keyed on its identity and shared read-only across sessions"""
+    return explode_investors(df)
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id}, max_entries=DATASET_CACHE_ENTRIES * 2)
+def investor_top_codes(df, col, k=3):
+    """Integer codes of each investor's k most frequent values in a column, padded with -1, plus the code labels"""
+    investor_df = investor_frame(df)
+    codes, labels = pd.factorize(investor_df[col])
+    counts = investor_df.groupby(['investor', pd.Series(codes, name=col)], sort=False, observed=True).size()
+    top = counts.sort_values(ascending=False, kind='stable').groupby(level='investor', sort=False, observed=True).head(k)
+    
+    investor_codes = top.index.get_level_values('investor').codes
+    top_codes = np.full((len(investor_df['investor'].cat.categories), k), -1, dtype=np.int32)
+    top_codes[investor_codes, top.groupby(level='investor', observed=True).cumcount().to_numpy()] = top.index.get_level_values(col)
+    return top_codes, labels
+
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: id}, max_entries=DATASET_CACHE_ENTRIES)
+def company_summary(df):
+    """One row per startup with its totals and latest profile, keyed on the identity of the shared processed frame and shared read-only"""
+    # The frame is sorted newest first, so 'first' picks each startup's latest vertical and city
+    return df.groupby('startup', observed=True).agg(
+        total_amount=('amount', 'sum'),
+        vertical=('vertical', 'first'),
+        subvertical=('subvertical', 'first'),
+        city=('city', 'first'),
+        last_date=('date', 'max'),
+        rounds=('date', 'size')
+    ).reset_index()
+
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: id}, max_entries=PROFILE_CACHE_ENTRIES)
+def similar_candidates(df, vertical, subvertical, city):
+    """Startups sharing a vertical, sub-vertical or city, largest total first, shared by every startup with the same profile"""
+    summary = company_summary(df)
+    similar = summary[
+        (summary['vertical'] == vertical) |
+        (summary['subvertical'] == subvertical) |
+        (summary['city'] == city)
+    ]
+    # A stable sort keeps ties in summary order, matching nlargest on any subset
+    return similar.sort_values('total_amount', ascending=False, kind='stable')
+
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: id}, max_entries=DATASET_CACHE_ENTRIES)
+def name_index(df):
+    """Map lowercase startup names to their row positions in the shared processed frame, shared read-only"""
+    return df.groupby(df['startup'].str.lower(), observed=True).indices
+
+def remap_categories(values, mapping, na_value=None):
+    """Map the categories of a categorical through a dict or function, merging any that collide"""
+    mapper = mapping if callable(mapping) else (lambda value: mapping.get(value, value))
+    mapped = values.cat.categories.map(mapper)
+    if na_value is not None:
+        # Missing rows carry code -1, which picks up this trailing entry below
+        mapped = mapped.append(pd.Index([na_value]))
+    codes, categories = pd.factorize(mapped, sort=True)
+    row_codes = values.cat.codes.to_numpy()
+    new_codes = codes[row_codes] if na_value is not None else np.where(row_codes >= 0, codes[row_codes], -1)
+    return pd.Series(pd.Categorical.from_codes(new_codes, categories=categories), index=values.index, name=values.name)
+
+def clean_label(value):
+    """Strip a text value and fold empty or 'nan' placeholders into 'Unknown'"""
+    value = str(value).strip()
+    return 'Unknown' if value in ('', 'nan') else value
+
+def process_data(df):
+    """Process and clean the startup funding data, reusing the freshly read frame instead of copying it"""
+    # Clean column names
+    df.columns = df.columns.str.strip().str.lower()
+    
+    # Convert date column unless the reader already parsed it; the dataset uses ISO dates, so skip per-row format inference
+    if not pd.api.types.is_datetime64_any_dtype(df['date']):
+        df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d', errors='coerce')
+    
+    # Clean startup names in one pass over the Arrow-backed strings
+    df['startup'] = df['startup'].astype('string[pyarrow]').str.strip().str.replace(STARTUP_NOISE, '', regex=True)
+    
+    # Clean amount column
+    # Amounts stay float64: float32 shifts most values and the summed totals the cards display
+    df['amount'] = pd.to_numeric(df['amount'], errors='coerce')
+    df['amount'] = df['amount'].fillna(0)
+    
+    # Clean and standardize other columns once per distinct value rather than once per row
+    for col in ['vertical', 'subvertical', 'city', 'round']:
+        df[col] = remap_categories(df[col].astype('category'), clean_label, na_value='Unknown')
+    
+    # Keep the free-text investors column Arrow-backed so table slices convert to Arrow without a copy
+    investors = df['investors'].astype('string[pyarrow]').str.strip()
+    df['investors'] = investors.mask(investors.isna() | investors.isin(['', 'nan']), 'Unknown')
+    
+    # Remove rows with missing critical data before the integer date parts are cast
+    df = df.dropna(subset=['date', 'startup'])
+    df = df[df['startup'] != 'Unknown']
+    
+    # Create additional derived columns once, in the narrowest dtypes that hold them, so pages group by label
+    df['year'] = df['date'].dt.year.astype('int16')
+    df['month'] = df['date'].dt.month.astype('int8')
+    df['quarter'] = df['date'].dt.quarter.astype('int8')
+    
+    # Sort by date, newest first; the per-startup 'first' aggregations rely on this to report the latest vertical and city
+    df = df.sort_values('date', ascending=False)
+    
+    # Store low-cardinality text columns as categoricals for faster nunique/groupby
+    # Plain object categories, matching what the Parquet copy restores
+    df['startup'] = df['startup'].astype(object).astype('category')
+    for col in ['vertical', 'subvertical', 'city', 'round']:
+        df[col] = df[col].cat.remove_unused_categories()
+    
+    # Standardize city names on the category table rather than row by row
+    city_mapping = {
+        'Bengaluru': 'Bangalore',
+        'Kormangala': 'Bangalore',
+        'Gurgaon': 'Gurugram',
+        'New Delhi': 'Delhi',
+        'Noida': 'Delhi NCR',
+        'Faridabad': 'Delhi NCR'
+    }
+    df['city'] = remap_categories(df['city'], lambda city: city_mapping.get(city.title(), city.title()))
+    
+    # Clean funding round names
+    round_mapping = {
+        'Seed Round': 'Seed',
+        'Seed Funding': 'Seed',
+        'Seed': 'Seed',
+        'Angel Round': 'Angel',
+        'Angel': 'Angel',
+        'Series A': 'Series A',
+        'Series B': 'Series B',
+        'Series C': 'Series C',
+        'Series D': 'Series D',
+        'Series E': 'Series E',
+        'Series F': 'Series F',
+        'Series G': 'Series G',
+        'Series H': 'Series H',
+        'Pre-Series A': 'Pre-Series A',
+        'Pre-series A': 'Pre-Series A',
+        'Private Equity Round': 'Private Equity',
+        'Private Equity': 'Private Equity',
+        'Debt Funding': 'Debt',
+        'Bridge Round': 'Bridge',
+        'Venture Round': 'Venture',
+        'Corporate Round': 'Corporate'
+    }
+    df['round'] = remap_categories(df['round'], round_mapping)
+    
+    return df
+
 class DataProcessor:
     def __init__(self, df):
-        self.df = df.copy()
-    
-    def process_data(self):
-        """Process and clean the startup funding data"""
-        df = self.df.copy()
-        
-        # Clean column names
-        df.columns = df.columns.str.strip().str.lower()
-        
-        # Convert date column
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
-        
-        # Clean startup names
-        df['startup'] = df['startup'].astype(str).str.strip()
-        df['startup'] = df['startup'].str.replace(r'^https?://[^\s]+', '', regex=True)
-        df['startup'] = df['startup'].str.replace(r'["\']', '', regex=True)
-        
-        # Clean amount column
-        df['amount'] = pd.to_numeric(df['amount'], errors='coerce')
-        df['amount'] = df['amount'].fillna(0)
-        
-        # Clean and standardize other columns
-        for col in ['vertical', 'subvertical', 'city', 'investors', 'round']:
-            df[col] = df[col].astype(str).str.strip()
-            df[col] = df[col].replace('nan', 'Unknown')
-            df[col] = df[col].replace('', 'Unknown')
-        
-        # Standardize city names
-        df['city'] = df['city'].str.title()
-        city_mapping = {
-            'Bengaluru': 'Bangalore',
-            'Kormangala': 'Bangalore',
-            'Gurgaon': 'Gurugram',
-            'New Delhi': 'Delhi',
-            'Noida': 'Delhi NCR',
-            'Faridabad': 'Delhi NCR'
-        }
-        df['city'] = df['city'].replace(city_mapping)
-        
-        # Create additional derived columns
-        df['year'] = df['date'].dt.year
-        df['month'] = df['date'].dt.month
-        df['quarter'] = df['date'].dt.quarter
-        df['month_year'] = df['date'].dt.to_period('M')
-        
-        # Clean funding round names
-        round_mapping = {
-            'Seed Round': 'Seed',
-            'Seed Funding': 'Seed',
-            'Seed': 'Seed',
-            'Angel Round': 'Angel',
-            'Angel': 'Angel',
-            'Series A': 'Series A',
-            'Series B': 'Series B',
-            'Series C': 'Series C',
-            'Series D': 'Series D',
-            'Series E': 'Series E',
-            'Series F': 'Series F',
-            'Series G': 'Series G',
-            'Series H': 'Series H',
-            'Pre-Series A': 'Pre-Series A',
-            'Pre-series A': 'Pre-Series A',
-            'Private Equity Round': 'Private Equity',
-            'Private Equity': 'Private Equity',
-            'Debt Funding': 'Debt',
-            'Bridge Round': 'Bridge',
-            'Venture Round': 'Venture',
-            'Corporate Round': 'Corporate'
-        }
-        df['round'] = df['round'].replace(round_mapping)
-        
-        # Remove rows with missing critical data
-        df = df.dropna(subset=['date', 'startup'])
-        df = df[df['startup'] != 'Unknown']
-        
-        # Sort by date
-        df = df.sort_values('date', ascending=False)
-        
-        return df
+        self.df = df
+    
+    def get_company_rows(self, df, company_name):
+        """Get the funding rows of a company by exact name, falling back to a substring match"""
+        positions = name_index(df).get(company_name.lower())
+        if positions is not None:
+            return df.iloc[positions]
+        
+        # Free-form text that is not a known name
+        return df[df['startup'].str.contains(company_name, case=False, na=False, regex=False)]
     
     def get_company_info(self, df, company_name):
         """Get detailed information about a specific company"""
-        company_data = df[df['startup'].str.contains(company_name, case=False, na=False)]
+        company_data = self.get_company_rows(df, company_name)
         
         if company_data.empty:
             return None
         
         # Get the most recent entry for basic info
-        latest_entry = company_data.iloc[0]
+        latest_entry = company_data.loc[company_data['date'].idxmax()]
         
         info = {
             'name': latest_entry['startup'],
@@ -104,32 +210,15 @@ class DataProcessor:
             'funding_rounds': len(company_data),
             'last_funding_date': company_data['date'].max(),
             'first_funding_date': company_data['date'].min(),
-            'funding_history': company_data[['date', 'round', 'amount', 'investors']].sort_values('date')
+            'funding_history': company_data.loc[:, ['date', 'round', 'amount', 'investors']].sort_values('date')
         }
         
         return info
     
-    def get_investor_info(self, df, investor_name):
+    def get_investor_info(self, df, investor_name, investor_df=None):
         """Get detailed information about a specific investor"""
-        # Split investors column and create expanded dataframe for analysis
-        investor_data = []
-        for _, row in df.iterrows():
-            investors = str(row['investors']).split(',')
-            for investor in investors:
-                investor = investor.strip()
-                if investor and investor.lower() != 'unknown':
-                    investor_data.append({
-                        'investor': investor,
-                        'startup': row['startup'],
-                        'date': row['date'],
-                        'amount': row['amount'],
-                        'round': row['round'],
-                        'vertical': row['vertical'],
-                        'city': row['city'],
-                        'year': row['year']
-                    })
-        
-        investor_df = pd.DataFrame(investor_data)
+        if investor_df is None:
+            investor_df = investor_frame(df)
         
         # Filter for specific investor
         investor_investments = investor_df[
@@ -144,7 +233,7 @@ class DataProcessor:
             'total_investments': len(investor_investments),
             'total_amount_invested': investor_investments['amount'].sum(),
             'avg_investment': investor_investments['amount'].mean(),
-            'recent_investments': investor_investments.sort_values('date', ascending=False).head(10),
+            'recent_investments': investor_investments.nlargest(10, 'date'),
             'biggest_investments': investor_investments.nlargest(10, 'amount'),
             'sectors': investor_investments['vertical'].value_counts(),
             'stages': investor_investments['round'].value_counts(),
@@ -159,56 +248,26 @@ class DataProcessor:
     
     def find_similar_companies(self, df, company_name, limit=5):
         """Find companies similar to the given company"""
-        company_data = df[df['startup'].str.contains(company_name, case=False, na=False)]
+        company_data = self.get_company_rows(df, company_name)
         
         if company_data.empty:
-            return []
+            return pd.DataFrame()
         
-        # Get company characteristics
-        target_vertical = company_data['vertical'].iloc[0]
-        target_subvertical = company_data['subvertical'].iloc[0]
-        target_city = company_data['city'].iloc[0]
+        # Get company characteristics from its most recent entry
+        latest_entry = company_data.loc[company_data['date'].idxmax()]
         
-        # Find similar companies
-        similar = df[
-            (df['vertical'] == target_vertical) |
-            (df['subvertical'] == target_subvertical) |
-            (df['city'] == target_city)
-        ]
+        # Find similar companies; the candidates are cached per profile, not per company
+        similar = similar_candidates(df, latest_entry['vertical'], latest_entry['subvertical'], latest_entry['city'])
         
         # Exclude the target company
-        similar = similar[~similar['startup'].str.contains(company_name, case=False, na=False)]
-        
-        # Group by startup and get summary
-        similar_summary = similar.groupby('startup').agg({
-            'amount': 'sum',
-            'vertical': 'first',
-            'subvertical': 'first',
-            'city': 'first',
-            'date': 'max'
-        }).reset_index()
+        similar_summary = similar[~similar['startup'].isin(company_data['startup'])]
         
-        similar_summary = similar_summary.sort_values('amount', ascending=False).head(limit)
-        
-        return similar_summary.to_dict('records')
+        return similar_summary.head(limit)
     
-    def find_similar_investors(self, df, investor_name, limit=5):
+    def find_similar_investors(self, df, investor_name, limit=5, investor_df=None):
         """Find investors similar to the given investor"""
-        # Create investor analysis dataframe
-        investor_data = []
-        for _, row in df.iterrows():
-            investors = str(row['investors']).split(',')
-            for investor in investors:
-                investor = investor.strip()
-                if investor and investor.lower() != 'unknown':
-                    investor_data.append({
-                        'investor': investor,
-                        'vertical': row['vertical'],
-                        'round': row['round'],
-                        'amount': row['amount']
-                    })
-        
-        investor_df = pd.DataFrame(investor_data)
+        if investor_df is None:
+            investor_df = investor_frame(df)
         
         # Get target investor characteristics
         target_investments = investor_df[
@@ -221,28 +280,25 @@ class DataProcessor:
         target_sectors = set(target_investments['vertical'].value_counts().head(3).index)
         target_stages = set(target_investments['round'].value_counts().head(3).index)
         
-        # Find similar investors
-        all_investors = investor_df.groupby('investor').agg({
-            'vertical': lambda x: set(x.value_counts().head(3).index),
-            'round': lambda x: set(x.value_counts().head(3).index),
-            'amount': ['sum', 'count']
-        }).reset_index()
-        
-        all_investors.columns = ['investor', 'top_sectors', 'top_stages', 'total_amount', 'investment_count']
+        # Find similar investors from each investor's three most frequent sectors and stages
+        def jaccard(col, target):
+            top_codes, labels = investor_top_codes(df, col)
+            overlap = np.isin(top_codes, labels.get_indexer(list(target))).sum(axis=1)
+            scores = overlap / ((top_codes >= 0).sum(axis=1) + len(target) - overlap)
+            return pd.Series(scores, index=investor_df['investor'].cat.categories)
         
-        # Calculate similarity score
-        def similarity_score(row):
-            sector_overlap = len(target_sectors.intersection(row['top_sectors'])) / len(target_sectors.union(row['top_sectors']))
-            stage_overlap = len(target_stages.intersection(row['top_stages'])) / len(target_stages.union(row['top_stages']))
-            return (sector_overlap + stage_overlap) / 2
+        all_investors = investor_df.groupby('investor', observed=True)['amount'].agg(['sum', 'count'])
+        all_investors.columns = ['total_amount', 'investment_count']
         
-        all_investors['similarity'] = all_investors.apply(similarity_score, axis=1)
+        # Calculate similarity score as the mean Jaccard overlap with the target's sectors and stages
+        all_investors['similarity'] = (jaccard('vertical', target_sectors) + jaccard('round', target_stages)) / 2
+        all_investors = all_investors.reset_index()
         
         # Exclude the target investor
         similar_investors = all_investors[
             ~all_investors['investor'].str.contains(investor_name, case=False, na=False)
         ]
         
-        similar_investors = similar_investors.sort_values('similarity', ascending=False).head(limit)
+        similar_investors = similar_investors.nlargest(limit, 'similarity')
         
         return similar_investors[['investor', 'total_amount', 'investment_count', 'similarity']].to_dict('records')
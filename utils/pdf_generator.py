@@ -9,6 +9,7 @@ from reportlab.lib.colors import HexColor
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
+from utils.data_processor import company_summary
 
 class PDFReportGenerator:
     def __init__(self, df, data_processor):
@@ -100,7 +101,7 @@ class PDFReportGenerator:
         elements.append(Paragraph("Market Overview", self.heading_style))
         
         # Top 10 sectors by funding
-        sector_funding = self.df.groupby('vertical')['amount'].sum().sort_values(ascending=False).head(10)
+        sector_funding = self.df.groupby('vertical', observed=True)['amount'].sum().nlargest(10)
         
         # Create pie chart for sectors
         fig = px.pie(
@@ -115,8 +116,9 @@ class PDFReportGenerator:
         elements.append(Spacer(1, 15))
         
         # Monthly funding trends
-        monthly_data = self.df.groupby(self.df['date'].dt.to_period('M'))['amount'].sum().reset_index()
-        monthly_data['date'] = monthly_data['date'].astype(str)
+        # Group on the precomputed year and month columns rather than converting every date to a period
+        monthly_data = self.df.groupby(['year', 'month'])['amount'].sum().reset_index()
+        monthly_data['date'] = monthly_data['year'].astype(str) + '-' + monthly_data['month'].astype(str).str.zfill(2)
         
         fig2 = px.line(
             monthly_data, 
@@ -138,11 +140,7 @@ class PDFReportGenerator:
         elements.append(Paragraph("Top Performers", self.heading_style))
         
         # Top funded startups
-        top_startups = self.df.groupby('startup').agg({
-            'amount': 'sum',
-            'vertical': 'first',
-            'city': 'first'
-        }).sort_values('amount', ascending=False).head(10)
+        top_startups = company_summary(self.df).nlargest(10, 'total_amount').set_index('startup')
         
         # Create table data
         table_data = [['Rank', 'Startup', 'Industry', 'City', 'Total Funding (₹M)']]
@@ -152,7 +150,7 @@ class PDFReportGenerator:
                 startup[:25] + "..." if len(startup) > 25 else startup,
                 data['vertical'][:15] + "..." if len(data['vertical']) > 15 else data['vertical'],
                 data['city'],
-                f"₹{data['amount']:.1f}M"
+                f"₹{data['total_amount']:.1f}M"
             ])
         
         # Create table
@@ -180,7 +178,7 @@ class PDFReportGenerator:
         elements.append(Paragraph("Geographic Distribution", self.heading_style))
         
         # City-wise funding
-        city_funding = self.df.groupby('city')['amount'].sum().sort_values(ascending=False).head(8)
+        city_funding = self.df.groupby('city', observed=True)['amount'].sum().nlargest(8)
         
         fig = px.bar(
             x=city_funding.index,
@@ -0,0 +1,141 @@
+import streamlit as st
+
+# Custom CSS for enhanced UI, built once per process rather than on every rerun
+CUSTOM_CSS = """
+<style>
+    /* Main dashboard styling */
+    .main > div {
+        padding-top: 2rem;
+    }
+    
+    /* Enhanced sidebar styling */
+    .css-1d391kg {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    }
+    
+    /* Card styling for metrics */
+    .metric-card {
+        background: white;
+        padding: 1.5rem;
+        border-radius: 10px;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        border-left: 4px solid #FF6B6B;
+        margin: 0.5rem 0;
+    }
+    
+    /* Row of metric cards rendered as a single HTML block */
+    .cards-grid {
+        display: grid;
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
+    
+    /* Section headers */
+    .section-header {
+        background: linear-gradient(90deg, #FF6B6B, #4ECDC4);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        font-size: 1.8rem;
+        font-weight: bold;
+        margin: 1.5rem 0;
+        padding: 0.5rem 0;
+        border-bottom: 2px solid #f0f2f6;
+    }
+    
+    /* Chart container styling */
+    .chart-container {
+        background: white;
+        padding: 1.5rem;
+        border-radius: 15px;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+        margin: 1rem 0;
+        border: 1px solid #e8e8e8;
+    }
+    
+    /* Enhanced button styling */
+    .stButton > button {
+        background: linear-gradient(45deg, #FF6B6B, #4ECDC4);
+        color: white;
+        border: none;
+        padding: 0.5rem 1rem;
+        border-radius: 25px;
+        font-weight: bold;
+        transition: all 0.3s ease;
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 4px 15px rgba(255, 107, 107, 0.4);
+    }
+    
+    /* Selectbox styling */
+    .stSelectbox > div > div {
+        background: white;
+        border: 2px solid #e8e8e8;
+        border-radius: 10px;
+        transition: border-color 0.3s ease;
+    }
+    
+    .stSelectbox > div > div:focus-within {
+        border-color: #FF6B6B;
+        box-shadow: 0 0 10px rgba(255, 107, 107, 0.3);
+    }
+    
+    /* Info boxes */
+    .info-box {
+        background: #f8f9fa;
+        border: 1px solid #dee2e6;
+        border-radius: 10px;
+        padding: 1rem;
+        margin: 1rem 0;
+        border-left: 4px solid #4ECDC4;
+    }
+    
+    /* Table styling */
+    .dataframe {
+        border-radius: 10px;
+        overflow: hidden;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+    }
+    
+    /* Navigation active state */
+    .nav-active {
+        background: linear-gradient(45deg, #FF6B6B, #4ECDC4);
+        color: white;
+        padding: 0.5rem;
+        border-radius: 5px;
+        margin: 0.2rem 0;
+    }
+    
+    /* Dashboard title styling */
+    .dashboard-title {
+        text-align: center;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        font-size: 3rem;
+        font-weight: bold;
+        margin: 1rem 0;
+        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
+    }
+    
+    /* Improved spacing */
+    .element-container {
+        margin: 0.5rem 0;
+    }
+    
+    /* Footer styling */
+    .footer {
+        text-align: center;
+        padding: 2rem;
+        color: #666;
+        border-top: 1px solid #e8e8e8;
+        margin-top: 3rem;
+    }
+</style>
+"""
+
+def inject_css():
+    """Inject the dashboard stylesheet into the current run"""
+    # Streamlit drops elements that are not re-emitted on a rerun, so this runs every time
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
@@ -1,39 +1,74 @@
+import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 
+# Per-startup and per-investor charts would otherwise keep a live figure for every entity ever viewed
+CHART_CACHE_ENTRIES = 256
+
 class Visualizations:
+    # The common chart builders are memoized on their aggregated inputs so unchanged views skip Plotly construction;
+    # the figures are shared rather than copied per rerun, so callers must not modify them
     @staticmethod
+    @st.cache_resource(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
     def create_pie_chart(data, values, names, title, height=400):
         """Create an interactive pie chart"""
-        fig = px.pie(
-            data, 
-            values=values, 
-            names=names, 
-            title=title,
-            height=height
-        )
+        if isinstance(data, pd.Series):
+            # Chart a Series directly: its index supplies the slice names, values and names only label the hover
+            fig = px.pie(
+                values=data.to_numpy(),
+                names=data.index.to_numpy(),
+                labels={'values': values, 'names': names},
+                title=title,
+                height=height
+            )
+        else:
+            fig = px.pie(
+                data, 
+                values=values, 
+                names=names, 
+                title=title,
+                height=height
+            )
         fig.update_traces(textposition='inside', textinfo='percent+label')
         fig.update_layout(showlegend=True)
         return fig
     
     @staticmethod
-    def create_bar_chart(data, x, y, title, color=None, height=400):
+    @st.cache_resource(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
+    def create_bar_chart(data, x, y, title, color=None, height=400, orientation=None):
         """Create an interactive bar chart"""
-        fig = px.bar(
-            data, 
-            x=x, 
-            y=y, 
-            title=title,
-            color=color,
-            height=height
-        )
+        if isinstance(data, pd.Series):
+            # Chart a Series directly: its index runs along the x axis, or the y axis for horizontal bars
+            names, amounts = data.index.to_numpy(), data.to_numpy()
+            fig = px.bar(
+                x=amounts if orientation == 'h' else names,
+                y=names if orientation == 'h' else amounts,
+                labels={'x': x, 'y': y},
+                title=title,
+                height=height,
+                orientation=orientation
+            )
+        else:
+            fig = px.bar(
+                data, 
+                x=x, 
+                y=y, 
+                title=title,
+                color=color,
+                height=height,
+                orientation=orientation
+            )
         fig.update_layout(xaxis_tickangle=-45)
+        if orientation == 'h':
+            # Largest bar on top
+            fig.update_layout(yaxis={'categoryorder': 'total ascending'})
         return fig
     
     @staticmethod
+    @st.cache_resource(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
     def create_line_chart(data, x, y, title, color=None, height=400):
         """Create an interactive line chart"""
         fig = px.line(
@@ -171,3 +206,8 @@ class Visualizations:
             height=height
         )
         return fig
+
+@st.cache_resource(show_spinner=False)
+def shared_visualizations():
+    """One Visualizations instance for every page and rerun; its builders are stateless"""
+    return Visualizations()